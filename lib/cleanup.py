@@ -9,7 +9,9 @@ from __future__ import annotations
 import argparse
 import contextlib
 import os
+import re
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
@@ -18,7 +20,6 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from rich.console import Console
-from rich.prompt import Confirm
 
 from .logging_utils import LoggingMixin
 from .paths import (
@@ -38,9 +39,57 @@ UTILS_AVAILABLE = True
 
 MAX_BACKUP_FILES = 1000
 
+# Any crontab line mentioning fplaunch, including its line terminator, so a
+# single substitution drops the line without splitting the whole buffer.
+_CRON_FPLAUNCH_LINE_RE = re.compile(r"(?m)^.*fplaunch.*(?:\n|$)")
+
+# Helper scripts installed into bin_dir alongside the generated wrappers.
+_KNOWN_SCRIPTS = frozenset(
+    {
+        "fplaunch-manage",
+        "fplaunch-generate",
+        "fplaunch-setup-systemd",
+        "fplaunch-cleanup",
+    }
+)
+
+_SYSTEMD_UNIT_SUFFIXES = frozenset({".service", ".path", ".timer"})
+_SYSTEMD_UNITS = ("fplaunch-wrapper.path", "fplaunch-wrapper.timer", "fplaunch-wrapper.service")
+
+# Display names for cleanup_items keys in the confirmation summary.
+_CATEGORY_LABELS = {
+    "wrappers": "Wrappers",
+    "symlinks": "Symlinks",
+    "scripts": "Scripts",
+    "systemd_units": "Systemd units",
+    "cron_entries": "Cron entries",
+    "completion_files": "Completion files",
+    "man_pages": "Man pages",
+    "config_dir": "Configuration directory",
+    "preferences": "Preferences",
+    "data_files": "Data files",
+}
+
 console = Console()
 
 
+def _scan_prefix_suffix(dir_path: Path, prefix: str, suffix: str) -> list[Path]:
+    """Return regular files in ``dir_path`` named ``<prefix>*<suffix>``.
+
+    A single ``os.scandir`` pass replaces ``Path.glob`` for these fixed
+    patterns; a missing directory simply yields no matches.
+    """
+    try:
+        with os.scandir(dir_path) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(suffix) and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
 @dataclass
 class CleanupConfig:
     bin_dir: str | None = None
@@ -98,6 +147,12 @@ class WrapperCleanup(LoggingMixin):
         self.bin_dir = self.config.bin_dir_path
         self.config_dir = self.config.config_dir_path
         self.data_dir = self.config.data_dir_path
+        # Per-user locations outside the configurable dirs, resolved once.
+        home = Path.home()
+        self._man_dir = home / ".local" / "share" / "man"
+        self._bash_completion = home / ".bashrc.d" / "fplaunch_completion.bash"
+        self._zsh_completion_dir = home / ".zsh" / "completions"
+        self._fish_completion_dir = home / ".config" / "fish" / "completions"
         self.systemd_unit_dir = self._get_systemd_unit_dir()
         self.remove_wrappers = self.config.remove_wrappers
         self.remove_prefs = self.config.remove_prefs
@@ -106,6 +161,9 @@ class WrapperCleanup(LoggingMixin):
         self.create_backup = self.config.create_backup
         self.backup_dir = Path(self.config.backup_dir) if self.config.backup_dir else None
         self.had_errors: bool = False
+        # is_wrapper_file() verdicts keyed by (st_dev, st_ino) of symlink targets.
+        self._wrapper_target_cache: dict[tuple[int, int], bool] = {}
+        self._which_cache: dict[str, str | None] = {}
 
         self.cleanup_items: dict[str, list] = {
             "wrappers": [],
@@ -127,6 +185,7 @@ class WrapperCleanup(LoggingMixin):
     def scan_for_cleanup_items(self) -> None:
         """Scan for items that can be cleaned up."""
         self.log("Scanning for cleanup items...")
+        self._wrapper_target_cache.clear()
 
         self._scan_wrapper_directory()
         self._scan_systemd_units()
@@ -136,55 +195,68 @@ class WrapperCleanup(LoggingMixin):
         self._scan_config_and_data_files()
 
     def _scan_wrapper_directory(self) -> None:
-        """Scan wrapper directory for wrappers, scripts, and symlinks."""
-        if not self.bin_dir.exists():
-            return
+        """Scan wrapper directory for wrappers, scripts, and symlinks.
 
+        Uses ``os.scandir`` so the file-type checks are answered from the
+        directory entry instead of costing a ``stat`` per item. Symlinks are
+        classified first, since ``is_file()`` would otherwise follow them and
+        report aliases of a wrapper as wrappers. A missing ``bin_dir`` is
+        handled by the exception rather than a prior probe.
+        """
         try:
-            for item in self.bin_dir.iterdir():
-                if item.is_file():
-                    self._handle_wrapper_file(item)
-                elif item.is_symlink():
-                    self._handle_wrapper_symlink(item)
-        except FileNotFoundError:
+            with os.scandir(self.bin_dir) as entries:
+                for entry in entries:
+                    if entry.is_symlink():
+                        self._handle_wrapper_symlink(Path(entry.path))
+                    elif entry.is_file(follow_symlinks=False):
+                        self._handle_wrapper_file(Path(entry.path))
+        except (FileNotFoundError, NotADirectoryError):
             pass
 
     def _handle_wrapper_file(self, item: Path) -> None:
         """Handle a regular file in the wrapper directory."""
         self.cleanup_items["wrappers"].append(item)
-        script_names = [
-            "fplaunch-manage",
-            "fplaunch-generate",
-            "fplaunch-setup-systemd",
-            "fplaunch-cleanup",
-        ]
-        if item.name in script_names:
+        if item.name in _KNOWN_SCRIPTS:
             self.cleanup_items["scripts"].append(item)
 
     def _handle_wrapper_symlink(self, item: Path) -> None:
         """Handle a symlink in the wrapper directory."""
         try:
-            # Use os.readlink for Python 3.8 compatibility (Path.readlink added in 3.9)
-            target = Path(os.readlink(item))
-            target_path = target if target.is_absolute() else self.bin_dir / target
-            if (
-                UTILS_AVAILABLE
-                and is_wrapper_file is not None
-                and is_wrapper_file(str(target_path))
-            ):
+            # Resolve the link with plain string ops; no Path is built for the target.
+            target = os.readlink(item)
+            if not os.path.isabs(target):
+                target = os.path.join(self.bin_dir, target)
+            if UTILS_AVAILABLE and is_wrapper_file is not None and self._is_wrapper_target(target):
                 self.cleanup_items["symlinks"].append(item)
         except (OSError, RuntimeError) as e:
             self.log(f"Could not read symlink {item}: {e}", level="debug")
 
+    def _is_wrapper_target(self, target_path: str | Path) -> bool:
+        """Return whether a symlink target is a wrapper, sniffing each inode once.
+
+        Aliases commonly point at the same wrapper, so the verdict is cached
+        by ``(st_dev, st_ino)`` for the duration of a scan. Dangling targets
+        are simply not wrappers.
+        """
+        try:
+            st = os.stat(target_path)
+        except OSError:
+            return False
+        key = (st.st_dev, st.st_ino)
+        cached = self._wrapper_target_cache.get(key)
+        if cached is None:
+            cached = bool(is_wrapper_file(str(target_path)))
+            self._wrapper_target_cache[key] = cached
+        return cached
+
     def _scan_man_pages(self) -> None:
         """Scan for man pages in standard locations."""
-        man_dir = Path.home() / ".local" / "share" / "man"
-        if not man_dir.exists():
-            return
-        for manpage in man_dir.glob("man1/fplaunch-*.1"):
-            self.cleanup_items["man_pages"].append(manpage)
-        for manpage in man_dir.glob("man7/fplaunchwrapper.*"):
-            self.cleanup_items["man_pages"].append(manpage)
+        self.cleanup_items["man_pages"].extend(
+            _scan_prefix_suffix(self._man_dir / "man1", "fplaunch-", ".1")
+        )
+        self.cleanup_items["man_pages"].extend(
+            _scan_prefix_suffix(self._man_dir / "man7", "fplaunchwrapper.", "")
+        )
 
     def _scan_config_and_data_files(self) -> None:
         """Scan for configuration preferences and data files."""
@@ -193,53 +265,44 @@ class WrapperCleanup(LoggingMixin):
 
     def _scan_preferences(self) -> None:
         """Scan for preference files in config directory."""
-        if not self.config_dir.exists():
-            return
-
+        # glob() yields nothing for a missing directory; no exists() probe needed.
         for item in self.config_dir.glob("*.pref"):
             if item.is_file():
                 self.cleanup_items["preferences"].append(item)
 
     def _scan_data_files(self) -> None:
         """Scan for data files in data directory."""
-        if not self.data_dir.exists():
-            return
-
         for item in self.data_dir.rglob("*"):
             if item.is_file():
                 self.cleanup_items["data_files"].append(item)
 
     def _scan_systemd_units(self) -> None:
         """Scan for all fplaunchwrapper-related systemd units."""
-        if self.systemd_unit_dir.exists():
-            # Find all systemd units related to fplaunchwrapper
-            # This includes the main flatpak-wrappers units and any app-specific units
-            for unit_path in self.systemd_unit_dir.glob("*fplaunch*"):
-                if unit_path.is_file() and unit_path.suffix in [
-                    ".service",
-                    ".path",
-                    ".timer",
-                ]:
-                    self.cleanup_items["systemd_units"].append(unit_path)
+        # Find all systemd units related to fplaunchwrapper, including the
+        # main units and any app-specific ones, in a single directory pass.
+        try:
+            with os.scandir(self.systemd_unit_dir) as entries:
+                for entry in entries:
+                    if (
+                        "fplaunch" in entry.name
+                        and os.path.splitext(entry.name)[1] in _SYSTEMD_UNIT_SUFFIXES
+                        and entry.is_file()
+                    ):
+                        self.cleanup_items["systemd_units"].append(Path(entry.path))
+        except (FileNotFoundError, NotADirectoryError):
+            pass
 
     def _scan_completion_files(self) -> None:
         """Scan for shell completion files for various shells (bash, zsh, fish)."""
         # Bash completion
-        bash_completion = Path.home() / ".bashrc.d" / "fplaunch_completion.bash"
-        if bash_completion.exists():
-            self.cleanup_items["completion_files"].append(bash_completion)
+        if self._bash_completion.exists():
+            self.cleanup_items["completion_files"].append(self._bash_completion)
 
         # Zsh completion
-        zsh_completion_dir = Path.home() / ".zsh" / "completions"
-        if zsh_completion_dir.exists():
-            for comp_file in zsh_completion_dir.glob("*fplaunch*"):
-                self.cleanup_items["completion_files"].append(comp_file)
+        self.cleanup_items["completion_files"].extend(self._zsh_completion_dir.glob("*fplaunch*"))
 
         # Fish completion
-        fish_completion_dir = Path.home() / ".config" / "fish" / "completions"
-        if fish_completion_dir.exists():
-            for comp_file in fish_completion_dir.glob("*fplaunch*"):
-                self.cleanup_items["completion_files"].append(comp_file)
+        self.cleanup_items["completion_files"].extend(self._fish_completion_dir.glob("*fplaunch*"))
 
         # System-wide completion directories. Only touch them when
         # euid == 0 (the project never runs ``cleanup`` as root for
@@ -269,7 +332,7 @@ class WrapperCleanup(LoggingMixin):
 
     def _scan_cron_entries(self) -> None:
         """Scan for all fplaunchwrapper-related cron entries."""
-        crontab_path = shutil.which("crontab")
+        crontab_path = self._which("crontab")
         if not crontab_path:
             return
 
@@ -315,7 +378,7 @@ class WrapperCleanup(LoggingMixin):
 
     def _has_cron_entries(self) -> bool:
         """Check if there are cron entries to clean up."""
-        crontab_path = shutil.which("crontab")
+        crontab_path = self._which("crontab")
         if not crontab_path:
             return False
         try:
@@ -346,22 +409,25 @@ class WrapperCleanup(LoggingMixin):
         self.log("- Man pages:         ~/.local/share/man")
         self.log("")
 
+        lines: list[str] = []
         total_items = 0
         for category, items in self.cleanup_items.items():
-            if items:
-                count = len(items)
-                total_items += count
-                if category == "config_dir":
-                    self.log(f"- Configuration directory ({count} item)")
-                elif category == "cron_entries":
-                    self.log(f"- Cron entries ({count} item)")
-                else:
-                    self.log(f"- {category.capitalize()}: {count} items")
+            if not items:
+                continue
+            count = len(items)
+            total_items += count
+            label = _CATEGORY_LABELS.get(category) or category.capitalize()
+            if category in ("config_dir", "cron_entries"):
+                lines.append(f"- {label} ({count} item)")
+            else:
+                lines.append(f"- {label}: {count} items")
 
         if total_items == 0:
             self.log("No cleanup items found.")
             return True
 
+        self.log("\n".join(lines))
+
         self.log(f"\nTotal items to remove: {total_items}")
 
         if self.dry_run:
@@ -371,6 +437,8 @@ class WrapperCleanup(LoggingMixin):
         if self.assume_yes or not self.interactive:
             return True
 
+        from rich.prompt import Confirm
+
         return bool(Confirm.ask("Proceed with cleanup?"))
 
     def _backup_items(
@@ -459,28 +527,31 @@ class WrapperCleanup(LoggingMixin):
         """Stop, disable and remove systemd units."""
         if not self.cleanup_items["systemd_units"]:
             return
-        systemctl_path = shutil.which("systemctl")
+        systemctl_path = self._which("systemctl")
         if systemctl_path:
             self.log("Stopping and disabling systemd units...")
             if not self.dry_run:
-                run_systemctl(
-                    "stop",
-                    "fplaunch-wrapper.path",
-                    "fplaunch-wrapper.timer",
-                    "fplaunch-wrapper.service",
-                )
-
-                run_systemctl(
-                    "disable",
-                    "fplaunch-wrapper.path",
-                    "fplaunch-wrapper.timer",
-                    "fplaunch-wrapper.service",
-                )
-
-                run_systemctl("daemon-reload")
-
+                # Only units whose files the scan found: systemctl rejects the
+                # whole ``disable --now`` (and so skips the stop) if any named
+                # unit file is missing, e.g. the .path unit newer installs lack.
+                scanned = {unit_path.name for unit_path in self.cleanup_items["systemd_units"]}
+                units = [unit for unit in _SYSTEMD_UNITS if unit in scanned]
+                if units:
+                    result = run_systemctl("disable", "--now", *units)
+                    if result.returncode != 0:
+                        self.log(
+                            f"systemctl disable --now failed: {result.stderr.strip()}",
+                            "warning",
+                        )
+
+        removed_any = False
         for unit_path in self.cleanup_items["systemd_units"]:
-            self._remove_file(unit_path, f"Removing systemd unit: {unit_path}")
+            if self._remove_file(unit_path, f"Removing systemd unit: {unit_path}"):
+                removed_any = True
+
+        # Reload only once unit files are actually gone, so systemd forgets them.
+        if systemctl_path and removed_any:
+            run_systemctl("daemon-reload", capture=False)
 
     def _cleanup_cron_entries(self) -> None:
         """Remove cron entries.
@@ -494,7 +565,7 @@ class WrapperCleanup(LoggingMixin):
         if not self.cleanup_items["cron_entries"]:
             return
 
-        crontab_path = shutil.which("crontab")
+        crontab_path = self._which("crontab")
         if not crontab_path:
             return
         self.log("Removing cron entries...")
@@ -512,7 +583,7 @@ class WrapperCleanup(LoggingMixin):
                 "error",
             )
             return
-        new_cron = "\n".join(line for line in result.stdout.split("\n") if "fplaunch" not in line)
+        new_cron = _CRON_FPLAUNCH_LINE_RE.sub("", result.stdout)
         write_result = run_crontab("-", input_text=new_cron)
         if write_result.returncode != 0:
             self.log(
@@ -523,15 +594,26 @@ class WrapperCleanup(LoggingMixin):
             )
 
     def _cleanup_wrappers_and_scripts(self) -> None:
-        """Remove wrappers, symlinks, and scripts."""
-        for wrapper in self.cleanup_items["wrappers"]:
-            self._remove_file(wrapper, f"Removing wrapper: {wrapper}")
-
-        for symlink in self.cleanup_items["symlinks"]:
-            self._remove_file(symlink, f"Removing symlink: {symlink}")
+        """Remove wrappers, symlinks, and scripts.
 
-        for script in self.cleanup_items["scripts"]:
-            self._remove_file(script, f"Removing script: {script}")
+        Each parent directory is opened once and entries are checked and
+        unlinked relative to that descriptor, instead of resolving the full
+        path again for every file.
+        """
+        dir_fds: dict[Path, int | None] = {}
+        try:
+            for category, label in (
+                ("wrappers", "wrapper"),
+                ("symlinks", "symlink"),
+                ("scripts", "script"),
+            ):
+                for path in self.cleanup_items[category]:
+                    dir_fd = None if self.dry_run else self._open_dir_fd(path.parent, dir_fds)
+                    self._remove_file(path, f"Removing {label}: {path}", dir_fd=dir_fd)
+        finally:
+            for fd in dir_fds.values():
+                if fd is not None:
+                    os.close(fd)
 
         lib_dir = self.bin_dir / "lib"
         if lib_dir.exists() and lib_dir.is_dir():
@@ -551,16 +633,14 @@ class WrapperCleanup(LoggingMixin):
             self._remove_file(manpage, f"Removing man page: {manpage}")
 
         if not self.dry_run:
-            man_dir = Path.home() / ".local" / "share" / "man"
-            for subdir in ["man1", "man7"]:
-                subdir_path = man_dir / subdir
-                if subdir_path.exists() and not any(subdir_path.iterdir()):
-                    with contextlib.suppress(OSError):
-                        subdir_path.rmdir()
-
-            if man_dir.exists() and not any(man_dir.iterdir()):
+            # rmdir() refuses non-empty or missing directories on its own
+            # (ENOTEMPTY/ENOENT), so no separate emptiness probe is needed.
+            for subdir in ("man1", "man7"):
                 with contextlib.suppress(OSError):
-                    man_dir.rmdir()
+                    os.rmdir(self._man_dir / subdir)
+
+            with contextlib.suppress(OSError):
+                os.rmdir(self._man_dir)
 
     def _cleanup_config_dir(self) -> None:
         """Remove configuration directory."""
@@ -571,7 +651,21 @@ class WrapperCleanup(LoggingMixin):
                 f"Removing config directory: {config_dir}",
             )
 
-    def _remove_file(self, path: Path, description: str) -> None:
+    @staticmethod
+    def _open_dir_fd(directory: Path, dir_fds: dict[Path, int | None]) -> int | None:
+        """Return a cached O_DIRECTORY descriptor for ``directory``.
+
+        ``None`` is cached when the directory cannot be opened, in which
+        case callers fall back to path-based removal.
+        """
+        if directory not in dir_fds:
+            try:
+                dir_fds[directory] = os.open(directory, os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC)
+            except OSError:
+                dir_fds[directory] = None
+        return dir_fds[directory]
+
+    def _remove_file(self, path: Path, description: str, dir_fd: int | None = None) -> bool:
         """Remove a file with logging.
 
         Defends against symlink-redirect attacks: a non-root user with
@@ -579,39 +673,51 @@ class WrapperCleanup(LoggingMixin):
         ``~/bin/firefox`` -> ``~/.ssh/authorized_keys`` and have
         ``cleanup`` unlink the target. We verify the path is a regular
         file owned by the current user before unlinking.
+
+        When ``dir_fd`` is an open descriptor for ``path.parent``, the
+        check and the unlink are done relative to it by name.
+
+        Returns True only when the file was actually unlinked.
         """
         self.log(description)
         if self.dry_run:
-            return
+            return False
         try:
             # O_NOFOLLOW + stat ownership check before unlink.
             try:
-                fd = os.open(str(path), os.O_PATH | os.O_NOFOLLOW)
+                if dir_fd is not None:
+                    st = os.stat(path.name, dir_fd=dir_fd, follow_symlinks=False)
+                else:
+                    fd = os.open(str(path), os.O_PATH | os.O_NOFOLLOW)
+                    try:
+                        st = os.fstat(fd)
+                    finally:
+                        os.close(fd)
             except OSError as e:
                 self.log(f"Warning: refusing to remove non-regular file {path}: {e}", "warning")
                 self.had_errors = True
-                return
-            try:
-                st = os.fstat(fd)
-                import stat as _stat
-
-                if not _stat.S_ISREG(st.st_mode):
-                    self.log(f"Warning: refusing to remove non-regular file {path}", "warning")
-                    self.had_errors = True
-                    return
-                if st.st_uid != os.getuid():
-                    self.log(
-                        f"Warning: refusing to remove file owned by uid={st.st_uid}: {path}",
-                        "warning",
-                    )
-                    self.had_errors = True
-                    return
-            finally:
-                os.close(fd)
-            path.unlink(missing_ok=True)
+                return False
+            if not stat.S_ISREG(st.st_mode):
+                self.log(f"Warning: refusing to remove non-regular file {path}", "warning")
+                self.had_errors = True
+                return False
+            if st.st_uid != os.getuid():
+                self.log(
+                    f"Warning: refusing to remove file owned by uid={st.st_uid}: {path}",
+                    "warning",
+                )
+                self.had_errors = True
+                return False
+            if dir_fd is not None:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(path.name, dir_fd=dir_fd)
+            else:
+                path.unlink(missing_ok=True)
         except OSError as e:
             self.log(f"Warning: Failed to remove {path}: {e}", "warning")
             self.had_errors = True
+            return False
+        return True
 
     def _remove_directory(self, path: Path, description: str) -> None:
         """Remove a directory with logging."""
@@ -623,9 +729,19 @@ class WrapperCleanup(LoggingMixin):
                 self.log(f"Warning: Failed to remove {path}: {e}", "warning")
                 self.had_errors = True
 
+    def _which(self, command: str) -> str | None:
+        """Resolve ``command`` on ``$PATH`` once per cleanup instance.
+
+        The scan, confirm and cleanup phases each ask for ``crontab`` and
+        ``systemctl``; every ``shutil.which`` call stats each ``$PATH`` entry.
+        """
+        if command not in self._which_cache:
+            self._which_cache[command] = shutil.which(command)
+        return self._which_cache[command]
+
     def _command_available(self, command: str) -> bool:
         """Check if a command is available."""
-        return shutil.which(command) is not None
+        return self._which(command) is not None
 
     def run(self) -> int:
         """Run the cleanup process."""
@@ -8,67 +8,66 @@ All CLI commands return int for shell exit codes:
 
 from __future__ import annotations
 
-from lib.cli_commands import cli, main
+from typing import TYPE_CHECKING
+
+from lib.cli_commands import cli, main, make_lazy_getattr
 from lib.cli_utils import run_command, find_fplaunch_script
 
 # Re-export console and import_handler for backward compatibility with tests
 from lib.cli_commands import console, console_err, import_handler
 
-# For backward compatibility, also expose individual commands from submodules
-from lib.cli_generation import (
-    generate,
-    list_wrappers,
-    install,
-    uninstall,
-    remove,
-    rm,
-    set_pref,
-    pref,
-)
-from lib.cli_system import (
-    launch,
-    cleanup,
-    clean,
-    monitor,
-)
-from lib.cli_systemd import (
-    systemd_setup_cmd,
-    systemd_group,
-    systemd_enable,
-    systemd_disable,
-    systemd_status,
-    systemd_start,
-    systemd_stop,
-    systemd_restart,
-    systemd_reload,
-    systemd_logs,
-    systemd_list,
-    systemd_test,
-)
-from lib.cli_profiles import (
-    profiles_group,
-    profiles_list,
-    profiles_create,
-    profiles_switch,
-    profiles_current,
-    profiles_export,
-    profiles_import,
-)
-from lib.cli_presets import (
-    presets_group,
-    presets_list,
-    presets_get,
-    presets_add,
-    presets_remove,
-)
-from lib.cli_inspect import (
-    info,
-    search,
-    discover,
-    files,
-    manifest,
-    config,
-)
+if TYPE_CHECKING:
+    # Provided lazily by __getattr__ at runtime; listed here for type
+    # checkers and linters.
+    from lib.cli_generation import (
+        generate,
+        install,
+        list_wrappers,
+        pref,
+        remove,
+        rm,
+        set_pref,
+        uninstall,
+    )
+    from lib.cli_inspect import config, discover, files, info, manifest, search
+    from lib.cli_presets import (
+        presets_add,
+        presets_get,
+        presets_group,
+        presets_list,
+        presets_remove,
+    )
+    from lib.cli_profiles import (
+        profiles_create,
+        profiles_current,
+        profiles_export,
+        profiles_group,
+        profiles_import,
+        profiles_list,
+        profiles_switch,
+    )
+    from lib.cli_system import clean, cleanup, launch, monitor
+    from lib.cli_systemd import (
+        systemd_disable,
+        systemd_enable,
+        systemd_group,
+        systemd_list,
+        systemd_logs,
+        systemd_reload,
+        systemd_restart,
+        systemd_setup_cmd,
+        systemd_start,
+        systemd_status,
+        systemd_stop,
+        systemd_test,
+    )
+
+# For backward compatibility, also expose individual commands from
+# submodules. They are resolved on first access (PEP 562, see
+# lib.cli_commands.LAZY_EXPORTS) so importing this module for
+# ``fplaunch-cli`` does not load every command module.
+__getattr__ = make_lazy_getattr(globals())
+
 
 __all__ = [
     # Main CLI
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 """CLI commands for fplaunchwrapper.
 
-This module defines the main Click CLI group and registers commands from
-submodules. Commands are split into logical groups:
+This module defines the main Click CLI group. Its subcommands live in
+submodules, listed in ``COMMAND_SOURCES`` and imported only when a command
+is looked up. Commands are split into logical groups:
 - cli_generation: generate, list, install, uninstall, remove, pref commands
 - cli_system: launch, cleanup, clean, monitor commands
 - cli_systemd: systemd-setup and systemd-* commands
@@ -13,13 +14,34 @@ submodules. Commands are split into logical groups:
 
 from __future__ import annotations
 
+import importlib
 import logging
 import sys
-from typing import Optional
+from collections.abc import Callable, Iterator, MutableMapping
+from typing import TYPE_CHECKING, Any, Optional
 
 import click
 from lib.cli_utils import console, console_err  # noqa: F401  (re-exported via lib.cli)
 
+if TYPE_CHECKING:
+    # Provided lazily by __getattr__ at runtime; listed here for type
+    # checkers and linters.
+    from lib.cli_generation import (
+        generate,
+        install,
+        list_wrappers,
+        pref,
+        remove,
+        rm,
+        set_pref,
+        uninstall,
+    )
+    from lib.cli_inspect import config, discover, files, info, manifest, search
+    from lib.cli_presets import presets_group
+    from lib.cli_profiles import profiles_group
+    from lib.cli_system import clean, cleanup, launch, monitor
+    from lib.cli_systemd import systemd_group, systemd_setup_cmd
+
 try:
     from . import __version__ as FPLAUNCH_VERSION
 except ImportError:
@@ -27,48 +49,173 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-# Import all command functions directly from submodules
-from lib.cli_generation import (  # noqa: E402
-    generate,
-    list_wrappers,
-    install,
-    uninstall,
-    remove,
-    rm,
-    set_pref,
-    pref,
-)
-from lib.cli_system import (  # noqa: E402
-    launch,
-    cleanup,
-    clean,
-    monitor,
-)
-from lib.cli_systemd import (  # noqa: E402
-    systemd_setup_cmd,
-    systemd_group,
-)
-from lib.cli_profiles import (  # noqa: E402
-    profiles_group,
-)
-from lib.cli_presets import (  # noqa: E402
-    presets_group,
-)
-from lib.cli_inspect import (  # noqa: E402
-    info,
-    search,
-    discover,
-    files,
-    manifest,
-    config,
-)
-
 # Re-export utilities for backward compatibility with tests
 from lib.cli_utils import run_command  # noqa: E402, F401, W0611
-from lib.cli_generation import import_handler  # noqa: E402, F401, W0611
+from lib.cli_imports import import_handler  # noqa: E402, F401, W0611
+
+# Top-level subcommands: CLI name -> (defining module, attribute). A
+# command's module is only imported when that command is resolved, so
+# running one subcommand does not evaluate every other module's decorators.
+COMMAND_SOURCES: dict[str, tuple[str, str]] = {
+    "generate": ("lib.cli_generation", "generate"),
+    "list": ("lib.cli_generation", "list_wrappers"),
+    "install": ("lib.cli_generation", "install"),
+    "uninstall": ("lib.cli_generation", "uninstall"),
+    "remove": ("lib.cli_generation", "remove"),
+    "rm": ("lib.cli_generation", "rm"),
+    "set-pref": ("lib.cli_generation", "set_pref"),
+    "pref": ("lib.cli_generation", "pref"),
+    "launch": ("lib.cli_system", "launch"),
+    "cleanup": ("lib.cli_system", "cleanup"),
+    "clean": ("lib.cli_system", "clean"),
+    "monitor": ("lib.cli_system", "monitor"),
+    "systemd-setup": ("lib.cli_systemd", "systemd_setup_cmd"),
+    "systemd": ("lib.cli_systemd", "systemd_group"),
+    "profiles": ("lib.cli_profiles", "profiles_group"),
+    "presets": ("lib.cli_presets", "presets_group"),
+    "info": ("lib.cli_inspect", "info"),
+    "search": ("lib.cli_inspect", "search"),
+    "discover": ("lib.cli_inspect", "discover"),
+    "files": ("lib.cli_inspect", "files"),
+    "manifest": ("lib.cli_inspect", "manifest"),
+    "config": ("lib.cli_inspect", "config"),
+}
+
+# Command objects re-exported from this module and lib.cli, by defining
+# module. Besides the top-level commands this includes the group
+# subcommands that lib.cli has always exposed.
+LAZY_EXPORTS: dict[str, tuple[str, ...]] = {
+    "lib.cli_generation": (
+        "generate",
+        "list_wrappers",
+        "install",
+        "uninstall",
+        "remove",
+        "rm",
+        "set_pref",
+        "pref",
+    ),
+    "lib.cli_system": (
+        "launch",
+        "cleanup",
+        "clean",
+        "monitor",
+    ),
+    "lib.cli_systemd": (
+        "systemd_setup_cmd",
+        "systemd_group",
+        "systemd_enable",
+        "systemd_disable",
+        "systemd_status",
+        "systemd_start",
+        "systemd_stop",
+        "systemd_restart",
+        "systemd_reload",
+        "systemd_logs",
+        "systemd_list",
+        "systemd_test",
+    ),
+    "lib.cli_profiles": (
+        "profiles_group",
+        "profiles_list",
+        "profiles_create",
+        "profiles_switch",
+        "profiles_current",
+        "profiles_export",
+        "profiles_import",
+    ),
+    "lib.cli_presets": (
+        "presets_group",
+        "presets_list",
+        "presets_get",
+        "presets_add",
+        "presets_remove",
+    ),
+    "lib.cli_inspect": (
+        "info",
+        "search",
+        "discover",
+        "files",
+        "manifest",
+        "config",
+    ),
+}
+_EXPORT_MODULES = {name: module for module, names in LAZY_EXPORTS.items() for name in names}
+
+
+def make_lazy_getattr(namespace: dict[str, Any]) -> Callable[[str], Any]:
+    """Build a PEP 562 ``__getattr__`` that resolves names in LAZY_EXPORTS.
+
+    The returned function imports the defining module on first access and
+    caches the value in ``namespace`` (the caller's ``globals()``), so later
+    lookups no longer reach ``__getattr__``.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = _EXPORT_MODULES.get(name)
+        if module is None:
+            raise AttributeError(f"module {namespace['__name__']!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        namespace[name] = value
+        return value
+
+    return __getattr__
+
+
+class LazyCommands(MutableMapping):
+    """Command registry for a Click group that imports commands on lookup.
+
+    Names are known up front from ``sources``, so listing commands (and
+    ``sorted(group.commands)`` inside Click) costs nothing; a command's
+    module is imported the first time that command is fetched.
+    """
+
+    def __init__(self, sources: dict[str, tuple[str, str]]) -> None:
+        self._pending = dict(sources)
+        self._loaded: dict[str, click.Command] = {}
+        self._order = list(sources)
+
+    def __getitem__(self, name: str) -> click.Command:
+        if name not in self._loaded:
+            module, attr = self._pending[name]
+            # Only drop the pending entry once the import has succeeded, so a
+            # failed import leaves the name listed and retryable.
+            self._loaded[name] = getattr(importlib.import_module(module), attr)
+            del self._pending[name]
+        return self._loaded[name]
+
+    def __setitem__(self, name: str, command: click.Command) -> None:
+        if name not in self._loaded and name not in self._pending:
+            self._order.append(name)
+        self._pending.pop(name, None)
+        self._loaded[name] = command
+
+    def __delitem__(self, name: str) -> None:
+        if name in self._loaded:
+            del self._loaded[name]
+        else:
+            del self._pending[name]
+        self._order.remove(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._order))
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._loaded or name in self._pending
+
+
+# Command objects are resolved from their modules on first use.
+__getattr__ = make_lazy_getattr(globals())
+
 
 __all__ = [
+    "COMMAND_SOURCES",
     "FPLAUNCH_VERSION",
+    "LAZY_EXPORTS",
+    "LazyCommands",
     "cli",
     "cleanup",
     "clean",
@@ -83,6 +230,7 @@ __all__ = [
     "install",
     "list_wrappers",
     "launch",
+    "make_lazy_getattr",
     "manifest",
     "monitor",
     "pref",
@@ -99,7 +247,7 @@ __all__ = [
 ]
 
 
-@click.group(invoke_without_command=True)
+@click.group(invoke_without_command=True, commands=LazyCommands(COMMAND_SOURCES))
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 @click.option("--config-dir", help="Override config directory")
 @click.option("--bin-dir", help="Override bin directory (where wrappers are installed)")
@@ -135,31 +283,6 @@ def cli(
         click.echo(ctx.get_help())
 
 
-# Register all commands with the CLI group
-cli.add_command(generate)
-cli.add_command(list_wrappers)
-cli.add_command(install)
-cli.add_command(uninstall)
-cli.add_command(remove)
-cli.add_command(rm)
-cli.add_command(set_pref)
-cli.add_command(pref)
-cli.add_command(launch)
-cli.add_command(cleanup)
-cli.add_command(clean)
-cli.add_command(monitor)
-cli.add_command(systemd_setup_cmd)
-cli.add_command(systemd_group)
-cli.add_command(profiles_group)
-cli.add_command(presets_group)
-cli.add_command(info)
-cli.add_command(search)
-cli.add_command(discover)
-cli.add_command(files)
-cli.add_command(manifest)
-cli.add_command(config)
-
-
 def main(argv: Optional[list[str]] = None) -> int:
     """Entrypoint used by console scripts. Dispatch to Click.
 
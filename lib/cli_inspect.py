@@ -190,7 +190,9 @@ def config_show(ctx: "Context") -> int:
     config_path = cfg.config_file
     if config_path.exists():
         console.print(f"[bold]Configuration file:[/bold] {config_path}")
-        console.print(config_path.read_text())
+        # Raw file contents: TOML "[section]" headers must not be taken as
+        # rich markup, and there is nothing worth highlighting.
+        console.print(config_path.read_text(), markup=False, highlight=False)
     else:
         console.print(
             f"[yellow]No configuration file found at {config_path}[/yellow]",
@@ -260,9 +262,8 @@ def config_list_presets(ctx: "Context") -> int:
     cfg = build_config_manager(ctx)
     presets = cfg.list_permission_presets()
     if presets:
-        console.print("Available permission presets:")
-        for preset in presets:
-            console.print(f"  {preset}")
+        lines = ["Available permission presets:", *(f"  {preset}" for preset in presets)]
+        console.print("\n".join(lines), markup=False)
     else:
         console.print("No permission presets defined")
     return 0
@@ -280,7 +281,6 @@ def config_get_preset(ctx: "Context", preset_name: str) -> int:
             f"[red]Error:[/red] Preset '{preset_name}' not found",
         )
         return 1
-    console.print(f"Permissions for preset '{preset_name}':")
-    for perm in permissions:
-        console.print(f"  {perm}")
+    lines = [f"Permissions for preset '{preset_name}':", *(f"  {perm}" for perm in permissions)]
+    console.print("\n".join(lines), markup=False)
     return 0
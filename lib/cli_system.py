@@ -7,7 +7,7 @@ from pathlib import Path
 
 import click
 from lib.cli_utils import console
-from lib.cli_generation import import_handler
+from lib.cli_imports import import_handler
 
 
 @click.command()
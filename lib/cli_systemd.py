@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Any
 import click
 
 from lib.cli_utils import console, console_err
-from lib.cli_generation import import_handler
+from lib.cli_imports import import_handler
 from lib.import_utils import safe_import
 
 if TYPE_CHECKING:
@@ -32,6 +32,14 @@ def _get_systemd_setup(ctx: "Context") -> Any:
     )
 
 
+def _require_systemd_setup(ctx: "Context") -> Any:
+    """Like _get_systemd_setup, but report a missing module on stderr."""
+    setup = _get_systemd_setup(ctx)
+    if setup is None:
+        console_err.print("[red]Error:[/red] systemd_setup module not available")
+    return setup
+
+
 @click.command(name="systemd-setup")
 @click.argument("bin_dir", required=False)
 @click.argument("wrapper_script", required=False)
@@ -42,31 +50,7 @@ def systemd_setup_cmd(
     wrapper_script: str | None,
 ) -> int:
     """Install/enable systemd units for automatic wrapper generation."""
-    SystemdSetup = import_handler.require("lib.systemd_setup", "SystemdSetup")
-    setup = SystemdSetup(
-        bin_dir=bin_dir,
-        config_dir=ctx.obj.get("config_dir"),
-        verbose=ctx.obj.get("verbose", False),
-        emit_mode=ctx.obj.get("emit", False),
-        emit_verbose=ctx.obj.get("emit_verbose", False),
-        wrapper_script=wrapper_script,
-    )
-    try:
-        if hasattr(setup, "run"):
-            result = setup.run()
-            return 0 if result == 0 else 1
-        if hasattr(setup, "install_systemd_units"):
-            result = setup.install_systemd_units()
-            return 0 if result else 1
-    except Exception as e:
-        logger.exception("Systemd setup failed: %s", e)
-        console_err.print(f"[red]Error:[/red] {e}")
-        return 1
-    console_err.print(
-        "[red]Error:[/red] SystemdSetup has no valid method "
-        "(neither 'run' nor 'install_systemd_units')"
-    )
-    return 1
+    return _run_systemd_setup(ctx, bin_dir, wrapper_script)
 
 
 @click.group(name="systemd", invoke_without_command=True)
@@ -115,9 +99,8 @@ def _run_systemd_setup(
 @click.pass_context
 def systemd_enable(ctx: "Context") -> int:
     """Enable the systemd service for automatic wrapper generation."""
-    setup = _get_systemd_setup(ctx)
+    setup = _require_systemd_setup(ctx)
     if setup is None:
-        console_err.print("[red]Error:[/red] systemd_setup module not available")
         return 1
     return 0 if setup.install_systemd_units() else 1
 
@@ -133,9 +116,8 @@ def systemd_enable(ctx: "Context") -> int:
 @click.pass_context
 def systemd_disable(ctx: "Context", assume_yes: bool) -> int:
     """Disable the systemd service and remove its unit files."""
-    setup = _get_systemd_setup(ctx)
+    setup = _require_systemd_setup(ctx)
     if setup is None:
-        console_err.print("[red]Error:[/red] systemd_setup module not available")
         return 1
     if (
         not assume_yes
@@ -155,9 +137,8 @@ def systemd_disable(ctx: "Context", assume_yes: bool) -> int:
 @click.pass_context
 def systemd_status(ctx: "Context") -> int:
     """Show status of the systemd service."""
-    setup = _get_systemd_setup(ctx)
+    setup = _require_systemd_setup(ctx)
     if setup is None:
-        console_err.print("[red]Error:[/red] systemd_setup module not available")
         return 1
     status = setup.check_systemd_status()
     console.print("[bold]fplaunch-wrapper.service:[/bold]")
@@ -243,9 +224,8 @@ def systemd_logs(ctx: "Context") -> int:
 @click.pass_context
 def systemd_list(ctx: "Context") -> int:
     """List managed systemd units."""
-    setup = _get_systemd_setup(ctx)
+    setup = _require_systemd_setup(ctx)
     if setup is None:
-        console_err.print("[red]Error:[/red] systemd_setup module not available")
         return 1
     units = setup.list_all_units()
     if units:
@@ -270,9 +250,8 @@ def systemd_test(ctx: "Context", emit: bool) -> int:
     if emit_mode:
         console.print("[yellow]EMIT: Would test systemd configuration[/yellow]")
         return 0
-    setup = _get_systemd_setup(ctx)
+    setup = _require_systemd_setup(ctx)
     if setup is None:
-        console_err.print("[red]Error:[/red] systemd_setup module not available")
         return 1
     status = setup.check_systemd_status()
     prerequisites_ok = setup.check_prerequisites()
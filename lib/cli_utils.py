@@ -4,14 +4,56 @@
 from __future__ import annotations
 
 import os
+import shlex
+import shutil
+import stat
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional, cast
 
-from rich.console import Console
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
-console_err = Console(stderr=True)
+
+class _LazyConsole:
+    """Stand-in for a rich ``Console`` that imports rich on first use.
+
+    ``--help``, ``--version`` and usage errors never print through rich, so
+    they skip importing it. Attribute reads, writes and deletes are
+    forwarded to the real Console, which keeps ``console.print(...)`` and
+    patches of ``console._file`` working unchanged.
+    """
+
+    __slots__ = ("_console", "_kwargs")
+    _console: Console | None
+    _kwargs: dict[str, Any]
+
+    def __init__(self, **kwargs: Any) -> None:
+        object.__setattr__(self, "_kwargs", kwargs)
+        object.__setattr__(self, "_console", None)
+
+    def _get(self) -> Console:
+        real = self._console
+        if real is None:
+            from rich.console import Console
+
+            real = Console(**self._kwargs)
+            object.__setattr__(self, "_console", real)
+        return real
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._get(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._get(), name)
+
+
+console = cast("Console", _LazyConsole())
+console_err = cast("Console", _LazyConsole(stderr=True))
 
 
 def run_command(
@@ -25,7 +67,11 @@ def run_command(
     Returns None in emit mode to indicate no actual execution occurred.
     """
     if emit_mode:
-        cmd_str = " ".join(cmd)
+        from rich.markup import escape
+
+        # Shell-quoted so the emitted line can be pasted back into a shell,
+        # and markup-escaped so arguments like "[x]" print literally.
+        cmd_str = escape(shlex.join(cmd))
         console.print(f"[cyan]📋 EMIT:[/cyan] {cmd_str}")
         if description:
             console.print(f"[dim]   Purpose: {description}[/dim]")
@@ -53,14 +99,42 @@ def run_command(
 
 
 def find_fplaunch_script(script_name: str) -> Optional[Path]:
-    """Search common locations for a helper script (e.g., fplaunch-generate)."""
-    candidates = [
-        Path.cwd() / script_name,
-        Path.home() / ".local" / "bin" / script_name,
-        Path("/usr/local/bin") / script_name,
-        Path("/usr/bin") / script_name,
-    ]
-    for p in candidates:
-        if p.exists() and p.is_file() and os.access(p, os.X_OK):
+    """Search common locations for a helper script (e.g., fplaunch-generate).
+
+    The current directory and ``~/.local/bin`` are checked first, then
+    ``$PATH``, then ``/usr/local/bin`` and ``/usr/bin``. Lookups are cached
+    per script name, working directory, home directory and ``$PATH``, so
+    repeated calls within one process cost no filesystem probes.
+    """
+    return _find_fplaunch_script_cached(
+        script_name,
+        os.getcwd(),
+        str(Path.home()),
+        os.environ.get("PATH", os.defpath),
+    )
+
+
+def _is_executable_file(path: Path) -> bool:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and os.access(path, os.X_OK)
+
+
+@lru_cache(maxsize=32)
+def _find_fplaunch_script_cached(
+    script_name: str, cwd: str, home: str, search_path: str
+) -> Optional[Path]:
+    # cwd and ~/.local/bin are probed directly rather than prepended to the
+    # PATH string, which would split directories whose names contain ":".
+    for p in (Path(cwd) / script_name, Path(home) / ".local" / "bin" / script_name):
+        if _is_executable_file(p):
+            return p
+    found = shutil.which(script_name, path=search_path)
+    if found:
+        return Path(found)
+    for p in (Path("/usr/local/bin") / script_name, Path("/usr/bin") / script_name):
+        if _is_executable_file(p):
             return p
     return None
@@ -4,10 +4,14 @@
 Main entry point for all operations.
 """
 
+from __future__ import annotations
+
 import sys
+from typing import TYPE_CHECKING, Any
 
-from . import safety as safety_mod
-from .safety import safe_launch_check  # noqa: F401  (re-exported for back-compat)
+if TYPE_CHECKING:
+    from . import safety
+    from .safety import safe_launch_check
 
 __all__ = [
     "main",
@@ -15,7 +19,19 @@ __all__ = [
     "safety",
 ]
 
-safety = safety_mod
+
+def __getattr__(name: str) -> Any:
+    """Re-export ``safety`` and ``safe_launch_check`` on first access (PEP 562).
+
+    Entry points that never run a safety check skip importing lib.safety.
+    """
+    if name in ("safety", "safe_launch_check"):
+        from . import safety
+
+        value = safety if name == "safety" else safety.safe_launch_check
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> int:
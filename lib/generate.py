@@ -34,7 +34,7 @@ import shutil
 import subprocess
 import sys
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from importlib.resources import files as importlib_files
 
@@ -62,6 +62,9 @@ from .python_utils import (
 )
 from .logging_utils import LoggingMixin
 
+if TYPE_CHECKING:
+    from .config_manager import EnhancedConfigManager
+
 console = _Console()
 logger = logging.getLogger(__name__)
 
@@ -89,12 +92,23 @@ class WrapperGenerator(LoggingMixin):
         self.emit_verbose = emit_verbose
         self.lock_name = "generate"
         self.config_dir = Path(config_dir) if config_dir else None
+        # Parsed on first use and shared by every wrapper in a run, instead
+        # of re-reading config.toml once per generated wrapper.
+        self._config_manager: EnhancedConfigManager | None = None
 
         if not self.emit_mode and self.config_dir is not None:
             ensure_dir(self.bin_dir)
             ensure_dir(self.config_dir)
             (self.config_dir / "bin_dir").write_text(str(self.bin_dir))
 
+    def _get_config_manager(self) -> EnhancedConfigManager:
+        """Return the generator's config manager, creating it on first use."""
+        if self._config_manager is None:
+            from .config_manager import create_config_manager
+
+            self._config_manager = create_config_manager()
+        return self._config_manager
+
     @staticmethod
     def _enforce_home_boundary(resolved: Path, original_str: str, user_home: Path) -> Path:
         """Check resolved path is under home or /tmp, falling back to ~/bin if not."""
@@ -258,10 +272,9 @@ class WrapperGenerator(LoggingMixin):
             pre_launch_script = ""
             post_launch_script = ""
             try:
-                from .config_manager import create_config_manager
                 from .config_validation import _validate_script_path_safety
 
-                config = create_config_manager()
+                config = self._get_config_manager()
                 failure_mode = getattr(
                     config.config,
                     "hook_failure_mode_default",
@@ -9,7 +9,7 @@ This module uses lazy imports for config_manager to avoid circular imports.
 See lib/generate.py for detailed explanation of the lazy import pattern.
 
 Key lazy imports in this module:
-- config_manager (in _get_hook_scripts, _get_effective_failure_mode, _resolve_flatpak_id)
+- config_manager (in _get_config_manager, _resolve_flatpak_id)
 - python_utils (in _resolve_flatpak_id)
 
 Usage:
@@ -32,10 +32,14 @@ import sys
 import threading
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .paths import get_default_config_dir, resolve_bin_dir, ensure_dir
 from .validation import validate_app_id
 
+if TYPE_CHECKING:
+    from .config_manager import EnhancedConfigManager
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,6 +112,20 @@ class AppLauncher:
         )
 
         self.args = args or []
+        # base_dir -> resolved base_dir for _is_path_safe; a launch checks
+        # bin_dir several times and realpath() walks every component.
+        self._resolved_dirs: dict[Path, Path] = {}
+        # Parsed on first use; hook lookup and failure-mode resolution would
+        # otherwise re-read config.toml for each of the pre and post hooks.
+        self._config_manager: EnhancedConfigManager | None = None
+
+    def _get_config_manager(self) -> EnhancedConfigManager:
+        """Return the launcher's config manager, creating it on first use."""
+        if self._config_manager is None:
+            from lib.config_manager import create_config_manager
+
+            self._config_manager = create_config_manager()
+        return self._config_manager
 
     def _get_hook_scripts(self, app_name: str, hook_type: str) -> list[Path]:
         """Get pre or post-launch hook scripts for an app.
@@ -125,9 +143,7 @@ class AppLauncher:
         scripts = []
 
         try:
-            from lib.config_manager import create_config_manager
-
-            config = create_config_manager()
+            config = self._get_config_manager()
             prefs = config.get_app_preferences(app_name)
 
             if hook_type == "pre" and prefs.pre_launch_script:
@@ -175,9 +191,7 @@ class AppLauncher:
             Failure mode: "abort", "warn", or "ignore"
         """
         try:
-            from lib.config_manager import create_config_manager
-
-            config = create_config_manager()
+            config = self._get_config_manager()
             mode: str = config.get_effective_hook_failure_mode(
                 self.app_name or "",
                 hook_type,
@@ -568,11 +582,15 @@ class AppLauncher:
 
         Prevents path traversal attacks by ensuring the path doesn't
         escape the intended directory. Resolves symlinks to handle
-        symlink-based escape attempts.
+        symlink-based escape attempts. The base directory is resolved once
+        per launcher; the candidate path is always resolved fresh.
         """
         try:
             resolved_path = path.resolve()
-            resolved_base = base_dir.resolve()
+            resolved_base = self._resolved_dirs.get(base_dir)
+            if resolved_base is None:
+                resolved_base = base_dir.resolve()
+                self._resolved_dirs[base_dir] = resolved_base
             resolved_path.relative_to(resolved_base)
             return True
         except (ValueError, OSError):
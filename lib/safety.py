@@ -15,6 +15,7 @@ import logging
 import os
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from .exceptions import (
@@ -41,6 +42,21 @@ __all__ = [
     "validate_flatpak_id",
 ]
 
+# Direct browser launches via ``flatpak run`` that would bypass the intended
+# app. Only specific known IDs are flagged, never the wrapper's own ID.
+DANGEROUS_WRAPPER_PATTERNS: tuple[str, ...] = (
+    "flatpak run org.mozilla.firefox",
+    "flatpak run com.google.Chrome",
+    "flatpak run org.chromium.Chromium",
+)
+
+# Matched against the raw wrapper bytes: one scan instead of one per pattern,
+# and no UTF-8 decode of the whole script (so non-UTF-8 content is still
+# inspected rather than silently skipped).
+_DANGEROUS_WRAPPER_RE = re.compile(
+    b"|".join(re.escape(pattern.encode()) for pattern in DANGEROUS_WRAPPER_PATTERNS)
+)
+
 
 def is_test_environment() -> bool:
     """Check if we're running in a test environment.
@@ -50,11 +66,21 @@ def is_test_environment() -> bool:
     2. sys.argv contains "test" -> True
     3. PYTEST_CURRENT_TEST environment variable set -> True
     4. pytest or unittest in sys.modules -> True
+
+    The explicit override is read on every call so it can be flipped at
+    runtime; the heuristics in steps 2-4 are computed once per process
+    (see :func:`_reset_test_env_cache`).
     """
     env_override = os.environ.get("FPWRAPPER_TEST_ENV")
     if env_override is not None:
         return env_override.lower().strip() == "true"
 
+    return _detect_test_environment()
+
+
+@lru_cache(maxsize=1)
+def _detect_test_environment() -> bool:
+    """Heuristic test-environment detection, memoized for the process."""
     explicit_test_arg = any((arg or "").lower() == "test" for arg in sys.argv)
     if explicit_test_arg:
         return True
@@ -65,6 +91,11 @@ def is_test_environment() -> bool:
     return "pytest" in sys.modules or "unittest" in sys.modules
 
 
+def _reset_test_env_cache() -> None:
+    """Forget the memoized heuristic result of :func:`is_test_environment`."""
+    _detect_test_environment.cache_clear()
+
+
 def validate_flatpak_id(flatpak_id: str) -> bool:
     """Validate a Flatpak ID format.
 
@@ -106,20 +137,9 @@ def is_dangerous_wrapper(wrapper_path: Path) -> bool:
     cases where a wrapper was manually edited or corrupted.
     """
     try:
-        if wrapper_path.exists():
-            content = wrapper_path.read_text()
-            # Check for direct browser launches via flatpak run that would
-            # bypass the intended app. Only flag specific known patterns
-            # where the run command does NOT match the wrapper's own ID.
-            dangerous_patterns = [
-                "flatpak run org.mozilla.firefox",
-                "flatpak run com.google.Chrome",
-                "flatpak run org.chromium.Chromium",
-            ]
-            return any(pattern in content for pattern in dangerous_patterns)
-    except (IOError, OSError, UnicodeDecodeError):
-        pass
-    return False
+        return _DANGEROUS_WRAPPER_RE.search(wrapper_path.read_bytes()) is not None
+    except (IOError, OSError):
+        return False
 
 
 def _is_direct_browser_launch(app_name: str) -> bool:
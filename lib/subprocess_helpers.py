@@ -7,10 +7,27 @@ import subprocess
 from typing import Any
 
 
-def run_systemctl(*args: str, timeout: int = 30) -> subprocess.CompletedProcess[str]:
-    """Run a systemctl command with common options."""
+def run_systemctl(
+    *args: str, timeout: int = 30, capture: bool = True
+) -> subprocess.CompletedProcess[str]:
+    """Run a systemctl command with common options.
+
+    With ``capture=False`` the child's stdout/stderr go straight to
+    /dev/null instead of through pipes; use it when only the return
+    code matters.
+    """
+    cmd = ["systemctl", "--user"] + list(args)
+    if not capture:
+        return subprocess.run(
+            cmd,
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=timeout,
+        )
     return subprocess.run(
-        ["systemctl", "--user"] + list(args),
+        cmd,
         check=False,
         capture_output=True,
         text=True,
@@ -176,6 +176,37 @@ class TestWrapperCleanupScanning:
             "fplaunch-wrapper.service" in str(p) for p in cleanup.cleanup_items["systemd_units"]
         )
 
+    def test_scan_systemd_units_filters_name_and_suffix(self, temp_env):
+        """Only fplaunch regular files with a unit suffix are collected."""
+        cleanup = WrapperCleanup(
+            config=CleanupConfig(
+                bin_dir=str(temp_env["bin_dir"]),
+                config_dir=str(temp_env["config_dir"]),
+                data_dir=str(temp_env["data_dir"]),
+            )
+        )
+        systemd_dir = cleanup.systemd_unit_dir
+        systemd_dir.mkdir(parents=True, exist_ok=True)
+        for name in ("fplaunch-wrapper.timer", "fplaunch-notes.txt", "other.service"):
+            (systemd_dir / name).write_text("x")
+        (systemd_dir / "fplaunch-dir.path").mkdir()
+        cleanup._scan_systemd_units()
+        names = sorted(p.name for p in cleanup.cleanup_items["systemd_units"])
+        assert names == ["fplaunch-wrapper.timer"]
+
+    def test_scan_systemd_units_missing_dir(self, temp_env):
+        """A missing unit directory yields no units and no error."""
+        cleanup = WrapperCleanup(
+            config=CleanupConfig(
+                bin_dir=str(temp_env["bin_dir"]),
+                config_dir=str(temp_env["config_dir"]),
+                data_dir=str(temp_env["data_dir"]),
+            )
+        )
+        cleanup.systemd_unit_dir = temp_env["temp_dir"] / "no-such-dir"
+        cleanup._scan_systemd_units()
+        assert cleanup.cleanup_items["systemd_units"] == []
+
     def test_scan_cron_entries_with_entries(self, temp_env):
         """Test scanning finds cron entries with fplaunch references."""
         mock_result = subprocess.CompletedProcess(
@@ -311,7 +342,7 @@ class TestWrapperCleanupConfirm:
             )
         )
         cleanup.scan_for_cleanup_items()
-        with patch("lib.cleanup.Confirm.ask", return_value=True):
+        with patch("rich.prompt.Confirm.ask", return_value=True):
             assert cleanup.confirm_cleanup() is True
 
     def test_confirm_cleanup_interactive_no(self, temp_env):
@@ -326,7 +357,7 @@ class TestWrapperCleanupConfirm:
             )
         )
         cleanup.scan_for_cleanup_items()
-        with patch("lib.cleanup.Confirm.ask", return_value=False):
+        with patch("rich.prompt.Confirm.ask", return_value=False):
             assert cleanup.confirm_cleanup() is False
 
     def test_confirm_cleanup_non_interactive_auto_yes(self, temp_env):
@@ -369,6 +400,24 @@ class TestWrapperCleanupConfirm:
         cleanup.cleanup_items["config_dir"].append(temp_env["config_dir"])
         assert cleanup.confirm_cleanup() is True
 
+    def test_confirm_cleanup_summary_uses_category_labels(self, temp_env, capsys):
+        """Each non-empty category is summarised once under its display label."""
+        cleanup = WrapperCleanup(
+            config=CleanupConfig(
+                bin_dir=str(temp_env["bin_dir"]),
+                config_dir=str(temp_env["config_dir"]),
+                data_dir=str(temp_env["data_dir"]),
+                assume_yes=True,
+            )
+        )
+        cleanup.cleanup_items["systemd_units"].append(temp_env["temp_dir"] / "a.service")
+        cleanup.cleanup_items["cron_entries"].append("0 * * * * fplaunch-generate")
+        assert cleanup.confirm_cleanup() is True
+        out = capsys.readouterr().out
+        assert "- Systemd units: 1 items" in out
+        assert "- Cron entries (1 item)" in out
+        assert "Total items to remove: 2" in out
+
 
 @pytest.mark.skipif(not CLEANUP_AVAILABLE, reason="WrapperCleanup not available")
 class TestWrapperCleanupPerform:
@@ -541,6 +590,20 @@ class TestWrapperCleanupHelpers:
         assert cleanup._command_available("sh") is True
         assert cleanup._command_available("definitely-not-a-command-xyz") is False
 
+    def test_which_resolved_once_per_instance(self, temp_env):
+        """Repeated lookups of the same command reuse the first resolution."""
+        cleanup = WrapperCleanup(
+            config=CleanupConfig(
+                bin_dir=str(temp_env["bin_dir"]),
+                config_dir=str(temp_env["config_dir"]),
+                data_dir=str(temp_env["data_dir"]),
+            )
+        )
+        with patch("lib.cleanup.shutil.which", return_value="/usr/bin/crontab") as mock_which:
+            assert cleanup._which("crontab") == "/usr/bin/crontab"
+            assert cleanup._command_available("crontab") is True
+        mock_which.assert_called_once_with("crontab")
+
 
 @pytest.mark.skipif(not CLEANUP_AVAILABLE, reason="WrapperCleanup not available")
 class TestWrapperCleanupLifecycle:
@@ -3,7 +3,7 @@
 
 Targeted gap regions (line numbers from coverage report):
 - 41-42:    safety import fallback (except ImportError: pass)
-- 158-159:  FileNotFoundError in _scan_wrapper_directory
+- 213-214:  FileNotFoundError in _scan_wrapper_directory
 - 171:      scripts list in _handle_wrapper_file
 - 184-186:  OSError/RuntimeError in _handle_wrapper_symlink
 - 262-263:  fplaunch files in /usr/local/share system completion dirs
@@ -111,18 +111,17 @@ class TestSafetyImportFallback:
             importlib.reload(orig_cleanup)
 
 
-# === 158-159: FileNotFoundError in _scan_wrapper_directory =================
+# === 213-214: FileNotFoundError in _scan_wrapper_directory =================
 
 
 class TestScanWrapperDirectoryRace:
-    """Lines 158-159: FileNotFoundError swallowed in iterdir()."""
+    """Lines 213-214: FileNotFoundError from os.scandir() is swallowed."""
 
-    def test_iterdir_raises_file_not_found(self, temp_env):
-        """When iterdir raises FNF, scan should not raise and adds nothing."""
+    def test_scandir_raises_file_not_found(self, temp_env):
+        """When scandir raises FNF, scan should not raise and adds nothing."""
         cleanup = make_cleanup(temp_env)
-        with patch.object(Path, "exists", lambda _p: True), patch.object(
-            Path, "iterdir", side_effect=FileNotFoundError("vanished")
-        ):
+        (temp_env["bin_dir"] / "wrapper").write_text("#!/bin/sh\n")
+        with patch("lib.cleanup.os.scandir", side_effect=FileNotFoundError("vanished")):
             cleanup._scan_wrapper_directory()
         assert cleanup.cleanup_items["wrappers"] == []
         assert cleanup.cleanup_items["symlinks"] == []
@@ -181,6 +180,34 @@ class TestSymlinkReadlinkErrors:
         cleanup._handle_wrapper_symlink(link)
         assert link in cleanup.cleanup_items["symlinks"]
 
+    def test_absolute_symlink_target(self, temp_env):
+        """Absolute link targets are used as-is, not joined onto bin_dir."""
+        cleanup = make_cleanup(temp_env)
+        real = temp_env["temp_dir"] / "elsewhere_wrapper"
+        real.write_text("#!/bin/bash\n# Generated by fplaunchwrapper\n")
+        link = temp_env["bin_dir"] / "abs_alias"
+        link.symlink_to(real)
+        with patch("lib.cleanup.is_wrapper_file", return_value=True) as mock_iwf:
+            cleanup._handle_wrapper_symlink(link)
+        assert link in cleanup.cleanup_items["symlinks"]
+        assert mock_iwf.call_args.args[0] == str(real)
+
+    def test_shared_target_sniffed_once(self, temp_env):
+        """Aliases of the same wrapper only read its header once per scan."""
+        cleanup = make_cleanup(temp_env)
+        real = temp_env["bin_dir"] / "real_wrapper"
+        real.write_text("#!/bin/bash\n# Generated by fplaunchwrapper\n")
+        links = []
+        for name in ("alias_a", "alias_b"):
+            link = temp_env["bin_dir"] / name
+            link.symlink_to("real_wrapper")
+            links.append(link)
+        with patch("lib.cleanup.is_wrapper_file", return_value=True) as mock_iwf:
+            cleanup._scan_wrapper_directory()
+        assert mock_iwf.call_count == 1
+        assert sorted(cleanup.cleanup_items["symlinks"]) == links
+        assert cleanup.cleanup_items["wrappers"] == [real]
+
 
 # === 262-263: system completion dirs =======================================
 
@@ -286,21 +313,86 @@ class TestBackupPaths:
 # === 457-478: _cleanup_systemd_units =======================================
 
 
+def _completed(returncode: int, stderr: str = "") -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout="", stderr=stderr)
+
+
 class TestCleanupSystemdUnits:
     """Lines 457-478: _cleanup_systemd_units with systemctl available."""
 
-    def test_with_systemctl_runs_stop_disable_reload(self, temp_env):
+    def test_with_systemctl_runs_disable_now_then_reload(self, temp_env):
         cleanup = make_cleanup(temp_env, dry_run=False, assume_yes=True)
-        unit = temp_env["temp_dir"] / "fplaunch-wrapper.service"
-        unit.parent.mkdir(parents=True, exist_ok=True)
-        unit.write_text("[Unit]\n")
-        cleanup.cleanup_items["systemd_units"] = [unit]
+        units = []
+        for name in ("fplaunch-wrapper.service", "fplaunch-wrapper.timer"):
+            unit = temp_env["temp_dir"] / name
+            unit.parent.mkdir(parents=True, exist_ok=True)
+            unit.write_text("[Unit]\n")
+            units.append(unit)
+        cleanup.cleanup_items["systemd_units"] = units
         with patch("lib.cleanup.shutil.which", return_value="/bin/systemctl"), patch(
-            "lib.cleanup.run_systemctl"
+            "lib.cleanup.run_systemctl", return_value=_completed(0)
         ) as mock_run:
             cleanup._cleanup_systemd_units()
-        assert mock_run.call_count == 3
-        assert not unit.exists()
+        assert [c.args for c in mock_run.call_args_list] == [
+            ("disable", "--now", "fplaunch-wrapper.timer", "fplaunch-wrapper.service"),
+            ("daemon-reload",),
+        ]
+        assert mock_run.call_args_list[-1].kwargs == {"capture": False}
+        assert not any(unit.exists() for unit in units)
+
+    def test_only_scanned_units_are_disabled(self, temp_env):
+        """Units whose files were not found are left out of the disable call."""
+        cleanup = make_cleanup(temp_env, dry_run=False, assume_yes=True)
+        cleanup.cleanup_items["systemd_units"] = [
+            temp_env["temp_dir"] / "fplaunch-wrapper.path",
+            temp_env["temp_dir"] / "fplaunch-app.service",
+        ]
+        with patch("lib.cleanup.shutil.which", return_value="/bin/systemctl"), patch(
+            "lib.cleanup.run_systemctl", return_value=_completed(0)
+        ) as mock_run:
+            cleanup._cleanup_systemd_units()
+        assert [c.args for c in mock_run.call_args_list] == [
+            ("disable", "--now", "fplaunch-wrapper.path"),
+        ]
+
+    def test_no_known_units_skips_disable(self, temp_env):
+        """An app-specific unit alone does not trigger a disable call."""
+        cleanup = make_cleanup(temp_env, dry_run=False, assume_yes=True)
+        cleanup.cleanup_items["systemd_units"] = [
+            temp_env["temp_dir"] / "fplaunch-app.service"
+        ]
+        with patch("lib.cleanup.shutil.which", return_value="/bin/systemctl"), patch(
+            "lib.cleanup.run_systemctl", return_value=_completed(0)
+        ) as mock_run:
+            cleanup._cleanup_systemd_units()
+        mock_run.assert_not_called()
+
+    def test_disable_failure_warns(self, temp_env):
+        """A failed disable is logged with systemctl's stderr."""
+        cleanup = make_cleanup(temp_env, dry_run=False, assume_yes=True)
+        cleanup.cleanup_items["systemd_units"] = [
+            temp_env["temp_dir"] / "fplaunch-wrapper.service"
+        ]
+        failed = _completed(1, stderr="Failed to disable unit.\n")
+        with patch("lib.cleanup.shutil.which", return_value="/bin/systemctl"), patch(
+            "lib.cleanup.run_systemctl", return_value=failed
+        ), patch.object(cleanup, "log") as mock_log:
+            cleanup._cleanup_systemd_units()
+        mock_log.assert_any_call(
+            "systemctl disable --now failed: Failed to disable unit.",
+            "warning",
+        )
+
+    def test_reload_skipped_when_no_unit_removed(self, temp_env):
+        """daemon-reload only runs after a unit file was actually deleted."""
+        cleanup = make_cleanup(temp_env, dry_run=False, assume_yes=True)
+        missing = temp_env["temp_dir"] / "fplaunch-wrapper.timer"
+        cleanup.cleanup_items["systemd_units"] = [missing]
+        with patch("lib.cleanup.shutil.which", return_value="/bin/systemctl"), patch(
+            "lib.cleanup.run_systemctl", return_value=_completed(0)
+        ) as mock_run:
+            cleanup._cleanup_systemd_units()
+        assert [c.args[0] for c in mock_run.call_args_list] == ["disable"]
 
     def test_dry_run_skips_systemctl(self, temp_env):
         cleanup = make_cleanup(temp_env, dry_run=True)
@@ -363,6 +455,23 @@ class TestCleanupCronEntries:
         assert "-" in second.args
         assert "fplaunch" not in second.kwargs.get("input_text", "")
 
+    def test_unrelated_lines_preserved_verbatim(self, temp_env):
+        """Only fplaunch lines are dropped; other lines keep their newlines."""
+        cleanup = make_cleanup(temp_env, dry_run=False, assume_yes=True)
+        cleanup.cleanup_items["cron_entries"] = ["x"]
+        result = subprocess.CompletedProcess(
+            args=[],
+            returncode=0,
+            stdout="MAILTO=me\n0 * * * * fplaunch-generate\n5 4 * * * backup\n",
+            stderr="",
+        )
+        with patch("lib.cleanup.shutil.which", return_value="/bin/crontab"), patch(
+            "lib.cleanup.run_crontab", return_value=result
+        ) as mock_run:
+            cleanup._cleanup_cron_entries()
+        written = mock_run.call_args_list[1].kwargs["input_text"]
+        assert written == "MAILTO=me\n5 4 * * * backup\n"
+
     def test_dry_run_skips_crontab(self, temp_env):
         cleanup = make_cleanup(temp_env, dry_run=True)
         cleanup.cleanup_items["cron_entries"] = ["line"]
@@ -428,6 +537,19 @@ class TestCleanupWrappersAndScripts:
         assert not s.exists()
         assert not sc.exists()
 
+    def test_symlink_target_outside_bin_dir_survives(self, temp_env):
+        """dir_fd-relative removal still refuses to follow a planted symlink."""
+        cleanup = make_cleanup(temp_env, dry_run=False, assume_yes=True)
+        secret = temp_env["temp_dir"] / "authorized_keys"
+        secret.write_text("ssh-ed25519 AAAA")
+        planted = temp_env["bin_dir"] / "firefox"
+        planted.symlink_to(secret)
+        cleanup.cleanup_items["wrappers"] = [planted]
+        cleanup._cleanup_wrappers_and_scripts()
+        assert secret.read_text() == "ssh-ed25519 AAAA"
+        assert planted.is_symlink()
+        assert cleanup.had_errors is True
+
     def test_lib_dir_removed(self, temp_env):
         cleanup = make_cleanup(temp_env, dry_run=False, assume_yes=True)
         lib = temp_env["bin_dir"] / "lib"
@@ -484,6 +606,17 @@ class TestCleanupManPages:
         # Parent man dir should be empty and removed
         assert not man_dir.exists()
 
+    def test_non_empty_man_dirs_kept(self, temp_env):
+        cleanup = make_cleanup(temp_env, dry_run=False, assume_yes=True)
+        man_dir = temp_env["home"] / ".local" / "share" / "man"
+        man1 = man_dir / "man1"
+        man1.mkdir(parents=True)
+        other = man1 / "other-tool.1"
+        other.write_text("keep")
+        cleanup._cleanup_man_pages()
+        assert other.exists()
+        assert man_dir.exists()
+
 
 # === 543-544: _cleanup_config_dir ==========================================
 
@@ -535,7 +668,7 @@ class TestRunCancellation:
         # Need at least one item so confirm_cleanup actually asks
         (temp_env["bin_dir"] / "firefox").write_text("x")
         cleanup = make_cleanup(temp_env, interactive=True)
-        with patch("lib.cleanup.Confirm.ask", return_value=False):
+        with patch("rich.prompt.Confirm.ask", return_value=False):
             assert cleanup.run() == 0
 
 
@@ -564,7 +697,7 @@ class TestCleanupCancellation:
         # Need at least one item so confirm_cleanup actually asks
         (temp_env["bin_dir"] / "firefox").write_text("x")
         cleanup = make_cleanup(temp_env, interactive=True)
-        with patch("lib.cleanup.Confirm.ask", return_value=False):
+        with patch("rich.prompt.Confirm.ask", return_value=False):
             assert cleanup.cleanup() is False
 
 
@@ -263,6 +263,13 @@ class TestWrapperCleanupReal:
 
     def test_cleanup_with_symlinks(self) -> None:
         """Test cleanup identifies and handles symlinks."""
+        # Symlinks are only collected when they point at a generated wrapper.
+        (self.bin_dir / "firefox").write_text(
+            "#!/usr/bin/env bash\n"
+            "# Generated by fplaunchwrapper\n"
+            'NAME="firefox"\n'
+            'ID="org.mozilla.firefox"\n'
+        )
         # Create a symlink to a wrapper
         symlink_path = self.bin_dir / "firefox-link"
         symlink_path.symlink_to(self.bin_dir / "firefox")
@@ -281,6 +288,22 @@ class TestWrapperCleanupReal:
         all_items = cleanup.cleanup_items["wrappers"] + cleanup.cleanup_items["symlinks"]
         assert any("firefox-link" in str(item) for item in all_items)
 
+    def test_cleanup_ignores_symlink_to_non_wrapper(self) -> None:
+        """A symlink to a file that is not a generated wrapper is left alone."""
+        (self.bin_dir / "python").symlink_to(self.temp_dir / "config" / "firefox.pref")
+
+        cleanup = WrapperCleanup(
+            bin_dir=str(self.bin_dir),
+            config_dir=str(self.config_dir),
+            data_dir=str(self.data_dir),
+            dry_run=True,
+        )
+
+        cleanup.scan_for_cleanup_items()
+
+        all_items = cleanup.cleanup_items["wrappers"] + cleanup.cleanup_items["symlinks"]
+        assert not any(item.name == "python" for item in all_items)
+
 
 class TestCleanupMainFunction:
     """Test the main() CLI function with REAL execution."""
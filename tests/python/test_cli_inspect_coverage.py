@@ -746,6 +746,30 @@ class TestConfigSubcommands:
 
         assert result.exit_code == 0
 
+    def test_config_show_prints_toml_sections_verbatim(
+        self,
+        cli_runner: CliRunner,
+        isolated_home: Any,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Section headers like ``[general]`` are printed, not parsed as markup."""
+        import io
+        from types import SimpleNamespace
+
+        body = '[general]\nbin_dir = "/x"\n[app_preferences.firefox]\n'
+        self._patched_config_manager(
+            monkeypatch,
+            config_file=SimpleNamespace(exists=lambda: True, read_text=lambda: body),
+        )
+        out = io.StringIO()
+        monkeypatch.setattr(cli_module.console, "_file", out)
+
+        result = cli_runner.invoke(cli_module.cli, ["config", "show"])
+
+        assert result.exit_code == 0
+        assert "[general]" in out.getvalue()
+        assert "[app_preferences.firefox]" in out.getvalue()
+
     def test_config_init(
         self,
         cli_runner: CliRunner,
@@ -916,6 +940,34 @@ class TestConfigSubcommands:
 
         assert result.exit_code == 0
 
+    def test_config_get_preset_prints_permissions_verbatim(
+        self,
+        cli_runner: CliRunner,
+        isolated_home: Any,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Preset permissions are printed as plain text, one per line."""
+        import io
+        from unittest.mock import MagicMock
+
+        self._patched_config_manager(
+            monkeypatch,
+            get_permission_preset=MagicMock(
+                return_value=["--filesystem=home", "--env=X=[y]"],
+            ),
+        )
+        out = io.StringIO()
+        monkeypatch.setattr(cli_module.console, "_file", out)
+
+        result = cli_runner.invoke(cli_module.cli, ["config", "get-preset", "advanced"])
+
+        assert result.exit_code == 0
+        assert out.getvalue().splitlines() == [
+            "Permissions for preset 'advanced':",
+            "  --filesystem=home",
+            "  --env=X=[y]",
+        ]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
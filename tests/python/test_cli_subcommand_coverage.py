@@ -11,6 +11,7 @@ real filesystem, ``flatpak``, or ``systemctl`` binaries.
 from __future__ import annotations
 
 import subprocess
+from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -210,6 +211,63 @@ class TestUninstallWrapperMissing:
             "org.example.NotInstalled", force=True
         )
 
+
+class TestLazyCommandRegistry:
+    """The top-level group resolves subcommands from COMMAND_SOURCES on demand."""
+
+    def test_every_source_resolves_to_its_named_command(self):
+        from lib.cli_commands import COMMAND_SOURCES
+
+        assert list(cli.commands) == list(COMMAND_SOURCES)
+        for name in COMMAND_SOURCES:
+            assert cli.commands[name].name == name
+
+    def test_running_one_command_imports_only_its_module(self):
+        code = (
+            "import sys\n"
+            "from lib.cli_commands import cli\n"
+            "assert 'lib.cli_inspect' not in sys.modules\n"
+            "assert cli.get_command(None, 'info') is not None\n"
+            "assert 'lib.cli_inspect' in sys.modules\n"
+            "assert 'lib.cli_systemd' not in sys.modules\n"
+        )
+        import sys
+
+        subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            cwd=Path(__file__).resolve().parent.parent.parent,
+        )
+
+    def test_failed_import_keeps_command_pending(self):
+        from lib.cli_commands import LazyCommands
+
+        commands = LazyCommands({"broken": ("lib.no_such_module", "broken")})
+        with pytest.raises(ImportError):
+            commands["broken"]  # noqa: B018
+        assert "broken" in commands and list(commands) == ["broken"]
+        with pytest.raises(ImportError):
+            commands["broken"]  # noqa: B018
+
+    def test_lazy_commands_mapping_semantics(self):
+        from lib.cli_commands import LazyCommands
+
+        commands = LazyCommands({"files": ("lib.cli_inspect", "files")})
+        assert "files" in commands and len(commands) == 1
+        extra = click.Command("extra")
+        commands["extra"] = extra
+        assert list(commands) == ["files", "extra"]
+        assert commands.get("extra") is extra
+        assert commands.get("missing") is None
+        del commands["files"]
+        assert list(commands) == ["extra"]
+
+    def test_lib_cli_reexports_resolve_lazily(self):
+        assert cli_module.launch is cli_system_module.launch
+        with pytest.raises(AttributeError):
+            cli_module.no_such_command  # noqa: B018
+
+
 class TestRegisterGenerationCommands:
     """Cover :func:`lib.cli_generation.register_commands` (lines 206-213)."""
 
@@ -2,12 +2,14 @@
 
 import io
 import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from rich.console import Console
 
-from lib.cli_utils import find_fplaunch_script, run_command
+from lib.cli_utils import _LazyConsole, find_fplaunch_script, run_command
 
 
 SCRIPT_NAME = "fplaunch-cli-utils-unlikely-script-xyz"
@@ -41,6 +43,13 @@ class TestRunCommandEmit:
         assert "EMIT:" in out
         assert "echo hi there" in out
 
+    def test_emit_quotes_arguments_for_the_shell(self, capture_console):
+        """Arguments with spaces or markup-like brackets are emitted shell-quoted and verbatim."""
+        buf, _ = capture_console
+        run_command(["flatpak", "run", "org.example.App", "my file", "[x]"], emit_mode=True)
+        out = buf.getvalue()
+        assert "flatpak run org.example.App 'my file' '[x]'" in out
+
     def test_emit_with_description_prints_purpose(self, capture_console):
         """emit_mode with a description also prints the dim 'Purpose:' line."""
         buf, _ = capture_console
@@ -159,6 +168,24 @@ class TestFindFplaunchScript:
         result = find_fplaunch_script(SCRIPT_NAME)
         assert result is None
 
+    def test_skips_executable_directory(self, monkeypatch, tmp_path):
+        """A directory with the script's name is not mistaken for the script."""
+        (tmp_path / SCRIPT_NAME).mkdir()
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert find_fplaunch_script(SCRIPT_NAME) is None
+
+    def test_finds_script_in_directory_with_colon(self, monkeypatch, tmp_path):
+        """A ":" in the working directory name is not treated as a separator."""
+        workdir = tmp_path / "p:q"
+        workdir.mkdir()
+        script = workdir / SCRIPT_NAME
+        script.write_text("#!/bin/sh\necho hi\n")
+        script.chmod(0o755)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.chdir(workdir)
+        assert find_fplaunch_script(SCRIPT_NAME) == script
+
     def test_finds_in_local_bin(self, monkeypatch, tmp_path):
         """Finds an executable in $HOME/.local/bin when cwd has no match."""
         local_bin = tmp_path / ".local" / "bin"
@@ -171,6 +198,32 @@ class TestFindFplaunchScript:
         result = find_fplaunch_script(SCRIPT_NAME)
         assert result == script
 
+    def test_finds_script_on_path(self, monkeypatch, tmp_path):
+        """Falls back to $PATH when cwd and ~/.local/bin have no match."""
+        path_dir = tmp_path / "venv" / "bin"
+        path_dir.mkdir(parents=True)
+        script = path_dir / SCRIPT_NAME
+        script.write_text("#!/bin/sh\necho hi\n")
+        script.chmod(0o755)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("PATH", str(path_dir))
+        monkeypatch.chdir(tmp_path)
+        assert find_fplaunch_script(SCRIPT_NAME) == script
+
+    def test_local_bin_takes_precedence_over_path(self, monkeypatch, tmp_path):
+        """~/.local/bin is checked before any $PATH entry."""
+        local_bin = tmp_path / ".local" / "bin"
+        path_dir = tmp_path / "venv" / "bin"
+        for directory in (local_bin, path_dir):
+            directory.mkdir(parents=True)
+            script = directory / SCRIPT_NAME
+            script.write_text("#!/bin/sh\necho hi\n")
+            script.chmod(0o755)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("PATH", str(path_dir))
+        monkeypatch.chdir(tmp_path)
+        assert find_fplaunch_script(SCRIPT_NAME) == local_bin / SCRIPT_NAME
+
     def test_cwd_takes_precedence_over_local_bin(self, monkeypatch, tmp_path):
         """cwd match is returned before ~/.local/bin match is considered."""
         cwd_script = tmp_path / SCRIPT_NAME
@@ -187,3 +240,50 @@ class TestFindFplaunchScript:
         monkeypatch.chdir(tmp_path)
         result = find_fplaunch_script(SCRIPT_NAME)
         assert result == cwd_script
+
+    def test_result_is_cached_per_location(self, monkeypatch, tmp_path):
+        """A repeat lookup from the same cwd/home does not re-probe the disk."""
+        script = tmp_path / SCRIPT_NAME
+        script.write_text("#!/bin/sh\necho hi\n")
+        script.chmod(0o755)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.chdir(tmp_path)
+        assert find_fplaunch_script(SCRIPT_NAME) == script
+        script.unlink()
+        assert find_fplaunch_script(SCRIPT_NAME) == script
+
+        other = tmp_path / "elsewhere"
+        other.mkdir()
+        monkeypatch.chdir(other)
+        assert find_fplaunch_script(SCRIPT_NAME) is None
+
+
+class TestLazyConsole:
+    """The module consoles defer importing rich until first use."""
+
+    def test_importing_cli_does_not_import_rich(self):
+        """Loading the CLI (e.g. for --help) leaves rich unimported."""
+        code = "import sys, lib.cli; assert 'rich.console' not in sys.modules"
+        subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            cwd=Path(__file__).resolve().parent.parent.parent,
+        )
+
+    def test_forwards_attribute_access(self):
+        """Reads and writes reach the underlying Console built with the given kwargs."""
+        lazy = _LazyConsole(stderr=True)
+        assert lazy.stderr is True
+        buffer = io.StringIO()
+        lazy.file = buffer
+        lazy.print("hello")
+        assert "hello" in buffer.getvalue()
+
+    def test_patch_object_round_trips(self):
+        """patch.object on the proxy installs and removes the mock cleanly."""
+        lazy = _LazyConsole()
+        original = lazy.print
+        with patch.object(lazy, "print") as mock_print:
+            lazy.print("x")
+        mock_print.assert_called_once_with("x")
+        assert lazy.print == original
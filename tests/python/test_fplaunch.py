@@ -2,6 +2,7 @@
 """Focused pytest coverage for lib.fplaunch (entry point module)."""
 
 import sys
+from pathlib import Path
 from unittest.mock import patch
 import pytest
 
@@ -38,6 +39,26 @@ class TestFplaunchModule:
         result = fplaunch.safe_launch_check("test-app")
         assert isinstance(result, bool)
 
+    def test_safety_imported_lazily(self) -> None:
+        import subprocess
+
+        code = (
+            "import sys; import lib.fplaunch as f; "
+            "assert 'lib.safety' not in sys.modules; "
+            "assert f.safety is sys.modules['lib.safety']"
+        )
+        subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            cwd=Path(__file__).resolve().parent.parent.parent,
+        )
+
+    def test_unknown_attribute_raises(self) -> None:
+        from lib import fplaunch
+
+        with pytest.raises(AttributeError):
+            fplaunch.no_such_attribute  # noqa: B018
+
 
 class TestFplaunchMain:
     """Test fplaunch.main() entry point."""
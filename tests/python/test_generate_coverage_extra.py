@@ -195,6 +195,24 @@ class TestCreateWrapperScriptEdgeCases:
         assert 'HOOK_FAILURE_MODE="warn"' in content
         assert 'PRE_SCRIPT="$HOOK_DIR/pre-launch.sh"' in content
 
+    def test_config_manager_shared_across_wrappers(self, tmp_path: Path) -> None:
+        """One generator parses the config once, not once per wrapper."""
+        gen = WrapperGenerator(
+            bin_dir=tmp_path / "bin",
+            config_dir=tmp_path / "cfg",
+        )
+        config = Mock()
+        config.config.hook_failure_mode_default = "abort"
+        config.get_app_preferences.return_value = SimpleNamespace(
+            pre_launch_script=None, post_launch_script=None
+        )
+        with patch("lib.config_manager.create_config_manager", return_value=config) as factory:
+            first = gen.create_wrapper_script("foo", "org.example.foo")
+            second = gen.create_wrapper_script("bar", "org.example.bar")
+        assert factory.call_count == 1
+        assert 'HOOK_FAILURE_MODE="abort"' in first
+        assert 'HOOK_FAILURE_MODE="abort"' in second
+
     def test_template_read_oserror(self, tmp_path: Path) -> None:
         """Lines 297-299: read_text on an existing template raises OSError -> wraps."""
         gen = WrapperGenerator(
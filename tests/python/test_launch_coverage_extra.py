@@ -442,6 +442,37 @@ class TestWrapperExists:
         # Path escapes bin_dir -> _is_path_safe returns False -> False
         assert launcher._wrapper_exists("../../etc/passwd") is False
 
+    def test_bin_dir_resolved_once_per_launcher(
+        self, temp_env: dict[str, Path]
+    ) -> None:
+        wrapper = temp_env["bin_dir"] / "test_app"
+        wrapper.write_text("#!/bin/bash\necho test\n")
+        wrapper.chmod(0o755)
+        launcher = _make_launcher(temp_env)
+        real_resolve = Path.resolve
+        resolved: list[Path] = []
+
+        def counting_resolve(self: Path, *args: object, **kwargs: object) -> Path:
+            resolved.append(self)
+            return real_resolve(self, *args, **kwargs)
+
+        with patch.object(Path, "resolve", counting_resolve):
+            assert launcher._find_wrapper() == wrapper
+            assert launcher._wrapper_exists() is True
+        assert resolved.count(launcher.bin_dir) == 1
+        assert resolved.count(wrapper) == 2
+
+    def test_config_manager_created_once_per_launcher(
+        self, temp_env: dict[str, Path]
+    ) -> None:
+        launcher = _make_launcher(temp_env)
+        config = Mock()
+        config.get_effective_hook_failure_mode.return_value = "ignore"
+        with patch("lib.config_manager.create_config_manager", return_value=config) as factory:
+            assert launcher._get_effective_failure_mode("pre") == "ignore"
+            assert launcher._get_effective_failure_mode("post") == "ignore"
+        assert factory.call_count == 1
+
 
 # ---------------------------------------------------------------------------
 # Lines 631-633: launch verbose warning on pre-launch hook failure
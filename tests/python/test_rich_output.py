@@ -407,8 +407,8 @@ class TestOutputCapture:
         (isolated_home.bin_dir / "orphan").write_text("#!/bin/bash\n")
         cleanup.scan_for_cleanup_items()
 
-        # Confirm.ask is called from cleanup module
-        with patch("lib.cleanup.Confirm.ask", return_value=True) as mock_confirm:
+        # Confirm is imported locally in confirm_cleanup, so patch it at the source
+        with patch("rich.prompt.Confirm.ask", return_value=True) as mock_confirm:
             result = cleanup.confirm_cleanup()
             mock_confirm.assert_called_once()
             assert result is True
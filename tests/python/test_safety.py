@@ -22,6 +22,7 @@ from lib.python_utils import (
     validate_home_dir,
 )
 from lib.safety import (
+    _reset_test_env_cache,
     is_dangerous_wrapper,
     is_test_environment,
     safe_launch_check,
@@ -33,6 +34,13 @@ from lib.safety import (
 class TestIsTestEnvironment:
     """Test test environment detection."""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_detection_cache(self):
+        """Each test patches argv/modules, so start and end with a cold cache."""
+        _reset_test_env_cache()
+        yield
+        _reset_test_env_cache()
+
     def test_with_test_arg(self) -> None:
         """Test is_test_environment with test argument."""
         with patch.object(sys, "argv", ["script", "test"]):
@@ -67,6 +75,18 @@ class TestIsTestEnvironment:
                     del sys.modules[mod]
                 assert is_test_environment() is False
 
+    def test_heuristic_result_is_memoized(self) -> None:
+        """Heuristics run once per process; the env override is still read live."""
+        env = {k: v for k, v in os.environ.items() if k != "FPWRAPPER_TEST_ENV"}
+        with patch.dict(os.environ, env, clear=True):
+            with patch.object(sys, "argv", ["script", "test"]):
+                assert is_test_environment() is True
+            # argv no longer mentions "test" but the cached answer stands.
+            with patch.object(sys, "argv", ["script"]):
+                assert is_test_environment() is True
+                os.environ["FPWRAPPER_TEST_ENV"] = "false"
+                assert is_test_environment() is False
+
 
 class TestSanitizeString:
     """Test string sanitization."""
@@ -257,6 +277,12 @@ class TestIsDangerousWrapper:
         wrapper_path = tmp_path / "nonexistent_wrapper"
         assert is_dangerous_wrapper(wrapper_path) is False
 
+    def test_non_utf8_content_still_scanned(self, tmp_path: Path) -> None:
+        """Undecodable bytes must not hide a dangerous launch line."""
+        wrapper_path = tmp_path / "binary_wrapper"
+        wrapper_path.write_bytes(b"#!/bin/sh\n\xff\xfe\nflatpak run com.google.Chrome\n")
+        assert is_dangerous_wrapper(wrapper_path) is True
+
 
 class TestSafeLaunchCheck:
     """Test safe launch checks."""
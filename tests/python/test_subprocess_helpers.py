@@ -42,6 +42,17 @@ class TestRunSystemctl:
         assert kwargs.get("text") is True
         assert kwargs.get("check") is False
 
+    def test_capture_false_discards_output(self):
+        """capture=False routes output to /dev/null instead of pipes."""
+        mock_result = subprocess.CompletedProcess(args=[], returncode=0)
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            run_systemctl("daemon-reload", capture=False)
+        kwargs = mock_run.call_args.kwargs
+        assert "capture_output" not in kwargs
+        assert kwargs.get("stdout") is subprocess.DEVNULL
+        assert kwargs.get("stderr") is subprocess.DEVNULL
+        assert kwargs.get("check") is False
+
     def test_returns_completed_process(self):
         """Test that the helper returns a CompletedProcess."""
         mock_result = subprocess.CompletedProcess(args=[], returncode=0, stdout="active", stderr="")
@@ -83,6 +83,24 @@ class TestSystemdCliEnableDisable:
             result = runner.invoke(cli, ["systemd", "enable"], standalone_mode=False)
         assert result.return_value == 1
 
+    @pytest.mark.parametrize(
+        "args",
+        [["enable"], ["disable", "--yes"], ["status"], ["list"], ["test"]],
+    )
+    def test_subcommands_report_missing_module(self, args, monkeypatch):
+        """Each subcommand reports an unavailable systemd_setup and returns 1."""
+        import io
+
+        from lib import cli_systemd
+
+        err = io.StringIO()
+        monkeypatch.setattr(cli_systemd.console_err, "_file", err)
+        runner = CliRunner()
+        with patch.object(cli_systemd, "_get_systemd_setup", return_value=None):
+            result = runner.invoke(cli, ["systemd", *args], standalone_mode=False)
+        assert result.return_value == 1
+        assert "systemd_setup module not available" in err.getvalue()
+
     def test_systemd_disable_success(self):
         """Test disable returns 0 on success."""
         from lib import cli_systemd